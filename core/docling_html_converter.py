@@ -27,7 +27,8 @@ class DoclingHtmlToMarkdownConverter:
         minio_secure: bool = True,
         image_url_prefix: Optional[str] = None,
         enable_image_processing: bool = False,
-        use_original_image_urls: bool = True
+        use_original_image_urls: bool = True,
+        clean_html: bool = False
     ):
         """
         初始化转换器
@@ -41,9 +42,11 @@ class DoclingHtmlToMarkdownConverter:
             image_url_prefix (str, optional): 图片 URL 前缀，如果为 None 则使用 MinIO 默认 URL
             enable_image_processing (bool): 是否启用图片处理功能，默认 False
             use_original_image_urls (bool): 是否使用原始图片链接，默认 True（推荐用于 HTML）
+            clean_html (bool): URL 转换时是否先用 lxml 去掉 script/style 再交给 Docling，默认 False
         """
         self.enable_image_processing = enable_image_processing
         self.use_original_image_urls = use_original_image_urls
+        self.clean_html = clean_html
         self.minio_client: Optional[Minio] = None
         
         # 只有在启用图片处理时才初始化 MinIO 相关配置
@@ -129,6 +132,35 @@ class DoclingHtmlToMarkdownConverter:
             print(f"❌ HTML 内容获取失败: {e}")
             raise
     
+    def _clean_html_content(self, html_content: str) -> str:
+        """
+        使用 lxml 去掉 script 和 style 节点，减少 Docling 需要解析的内容
+        
+        noscript 节点保留，懒加载页面的真实 <img> 通常放在其中。
+        
+        Args:
+            html_content (str): 原始 HTML 内容
+            
+        Returns:
+            str: 清理后的 HTML 内容，解析失败时返回原始内容
+        """
+        try:
+            import lxml.html
+            
+            tree = lxml.html.document_fromstring(html_content)
+            for node in tree.xpath('//script | //style'):
+                node.drop_tree()
+            # 序列化整个文档树并保留原有的 <!DOCTYPE>，避免改变 Docling 的解析模式
+            root_tree = tree.getroottree()
+            cleaned = lxml.html.tostring(
+                root_tree, encoding='unicode', doctype=root_tree.docinfo.doctype or None
+            )
+            print(f"🧹 HTML 清理完成: {len(html_content)} -> {len(cleaned)} 字符")
+            return cleaned
+        except Exception as e:
+            print(f"⚠️ HTML 清理失败，使用原始内容: {e}")
+            return html_content
+    
     def _save_html_to_temp_file(self, html_content: str, temp_dir: str) -> str:
         """
         将 HTML 内容保存到临时文件
@@ -661,8 +693,10 @@ class DoclingHtmlToMarkdownConverter:
             # 获取 HTML 内容
             html_content = self._fetch_html_from_url(html_url)
             
-            # 保存 HTML 到临时文件
-            html_file_path = self._save_html_to_temp_file(html_content, temp_dir)
+            # 保存 HTML 到临时文件（启用清理时只把清理后的内容交给 Docling，
+            # 图片 URL 仍从原始 HTML 中提取）
+            docling_html = self._clean_html_content(html_content) if self.clean_html else html_content
+            html_file_path = self._save_html_to_temp_file(docling_html, temp_dir)
             
             # 调用核心转换方法
             return self._convert_html_file_to_markdown(html_file_path, temp_dir, html_content, html_url)
@@ -1,8 +1,11 @@
 import re
+import sys
 from dataclasses import dataclass
-from typing import List
+from functools import cached_property
+from typing import Iterable, List, Tuple
 
 import jieba
+import numpy as np
 from datasketch import MinHash
 
 
@@ -22,6 +25,16 @@ class Document:
     minhash_signature: bytes
     token_set: str
 
+    @cached_property
+    def signature_array(self) -> np.ndarray:
+        """
+        MinHash 签名的 uint64 数组视图，首次访问时创建并缓存。
+
+        Returns:
+            np.ndarray: 基于 minhash_signature 字节的只读 uint64 数组。
+        """
+        return np.frombuffer(self.minhash_signature, dtype=np.uint64)
+
     @staticmethod
     def generate_minhash_signature(tokens: List[str], num_perm: int) -> bytes:
         """
@@ -35,9 +48,26 @@ class Document:
             bytes: 生成的 MinHash 签名，存储为字节数组。
         """
         m = MinHash(num_perm=num_perm)
-        for token in tokens:
-            m.update(token.lower().encode("utf8"))
-        return m.hashvalues.astype('>u8').tobytes()
+        m.update_batch([token.lower().encode("utf8") for token in tokens])
+        return Document._signature_bytes(m.hashvalues)
+
+    @staticmethod
+    def _signature_bytes(hashvalues: np.ndarray) -> bytes:
+        """
+        将 MinHash 哈希值数组转换为大端序字节签名（内部方法）。
+
+        小端平台上原地交换字节序后直接导出，省去 astype('>u8') 的中间拷贝。
+        会破坏传入的数组，只用于本类中生成签名后即丢弃的临时 MinHash。
+
+        Args:
+            hashvalues (np.ndarray): MinHash 哈希值（本机字节序的 uint64 数组）。
+
+        Returns:
+            bytes: 大端序的签名字节。
+        """
+        if sys.byteorder == "little":
+            hashvalues.byteswap(inplace=True)
+        return hashvalues.tobytes()
 
     @classmethod
     def from_text(cls, doc_id: int, doc_name: str, content: str, num_perm: int):
@@ -58,6 +88,32 @@ class Document:
         token_str = " ".join(set(tokens))
         return cls(doc_id, doc_name, signature, token_str)
 
+    @classmethod
+    def from_texts(cls, items: Iterable[Tuple[int, str, str]], num_perm: int) -> List["Document"]:
+        """
+        批量根据文本内容生成 Document 对象。
+
+        所有文档共用一组 MinHash 置换参数，每个文档的 token 哈希一次性向量化计算，
+        生成的签名与逐个调用 from_text 的结果一致。
+
+        Args:
+            items (Iterable[Tuple[int, str, str]]): (doc_id, doc_name, content) 元组序列。
+            num_perm (int): MinHash 的维度（哈希函数的数量）。
+
+        Returns:
+            List[Document]: 文档对象列表，顺序与输入一致。
+        """
+        items = list(items)
+        token_lists = [cls.split(content) for _, _, content in items]
+        minhashes = MinHash.bulk(
+            [[token.lower().encode("utf8") for token in tokens] for tokens in token_lists],
+            num_perm=num_perm
+        )
+        return [
+            cls(doc_id, doc_name, cls._signature_bytes(m.hashvalues), " ".join(set(tokens)))
+            for (doc_id, doc_name, _), tokens, m in zip(items, token_lists, minhashes)
+        ]
+
     @staticmethod
     def split(text: str) -> list:
         """
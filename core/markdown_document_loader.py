@@ -0,0 +1,51 @@
+from core.document import Document
+from core.markdown_file_processor import MarkdownFileProcessor
+
+# 每个进程共享一个 Markdown 解析器，由 init_worker 在进程启动时创建，未初始化时在首次使用时创建
+_PROCESSOR = None
+
+
+def init_worker():
+    """
+    进程初始化函数，每个进程只创建一次 MarkdownFileProcessor。
+    可作为 multiprocessing.Pool 的 initializer，也可在主进程中直接调用。
+    """
+    global _PROCESSOR
+    _PROCESSOR = MarkdownFileProcessor()
+
+
+def markdown_to_text(md_text):
+    """
+    使用当前进程的 Markdown 解析器将 Markdown 解析为纯文本，解析器尚未创建时先创建。
+
+    Args:
+        md_text (str): Markdown 文本。
+
+    Returns:
+        str: 纯文本。
+    """
+    if _PROCESSOR is None:
+        init_worker()
+    return _PROCESSOR.markdown_to_text(md_text)
+
+
+def build_document(job):
+    """
+    读取单个 Markdown 文件并生成 Document（可在工作进程中执行）。
+
+    Args:
+        job (tuple): (doc_id, 文件名, 文件路径, MinHash 维度)。
+
+    Returns:
+        Document: 生成的文档对象。
+    """
+    doc_id, md_file, file_path, num_perm = job
+    with open(file_path, 'r', encoding='utf-8') as f:
+        markdown_text = f.read()
+    content = markdown_to_text(markdown_text)
+    return Document.from_text(
+        doc_id=doc_id,
+        doc_name=md_file,
+        content=content,
+        num_perm=num_perm
+    )
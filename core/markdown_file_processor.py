@@ -10,12 +10,7 @@ class MarkdownFileProcessor:
 
     def markdown_to_text(self, md_text: str) -> str:
         """解析 Markdown 为纯文本"""
-        tokens = self.md.parse(md_text)
-        text_parts = []
-        for token in tokens:
-            if token.type == "inline":
-                text_parts.append(token.content)
-        return "\n".join(text_parts)
+        return "\n".join(t.content for t in self.md.parse(md_text) if t.type == "inline")
 
     def process_file(self, file_path: Path) -> list:
         """读取并处理单个 Markdown 文件"""
@@ -8,8 +8,20 @@ import os
 sys.path.append('/Users/joe/codes/gitee/dup-doc-hunter')
 
 from core.docling_html_converter import DoclingHtmlToMarkdownConverter
+from functools import lru_cache
 import tempfile
 
+
+@lru_cache(maxsize=None)
+def public_methods(cls):
+    """按类型收集公开方法名，只查类字典，不触发实例属性的计算"""
+    names = set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if not name.startswith('_') and (callable(value) or isinstance(value, (classmethod, staticmethod))):
+                names.add(name)
+    return sorted(names)
+
 def debug_html_images():
     """调试 HTML 图片对象结构"""
     
@@ -52,7 +64,7 @@ def debug_html_images():
         
         print(f"\n📄 文档转换完成")
         print(f"   文档类型: {type(doc)}")
-        print(f"   文档属性: {dir(doc)}")
+        print(f"   文档属性: {list(vars(doc))}")
         
         # 检查图片
         if hasattr(doc, 'pictures') and doc.pictures:
@@ -61,7 +73,7 @@ def debug_html_images():
             for i, picture in enumerate(doc.pictures):
                 print(f"\n🔍 图片 {i+1} 详细信息:")
                 print(f"   类型: {type(picture)}")
-                print(f"   属性列表: {dir(picture)}")
+                print(f"   属性列表: {list(vars(picture))}")
                 
                 # 检查所有属性的值
                 if hasattr(picture, '__dict__'):
@@ -79,17 +91,8 @@ def debug_html_images():
                     else:
                         print(f"     {attr_name}: 不存在")
                 
-                # 检查方法 - 避免访问某些特殊属性
-                methods = []
-                for method_name in dir(picture):
-                    if (not method_name.startswith('_') and 
-                        method_name not in ['__signature__', '__fields__', '__fields_set__']):
-                        try:
-                            method_obj = getattr(picture, method_name)
-                            if callable(method_obj):
-                                methods.append(method_name)
-                        except Exception:
-                            pass  # 跳过无法访问的属性
+                # 检查方法 - 同一类型只收集一次
+                methods = public_methods(type(picture))
                 print(f"   可用方法: {methods}")
                 
                 # 尝试调用一些方法
@@ -81,15 +81,14 @@ def debug_html_markdown_conversion():
         debug_file = "/Users/joe/codes/gitee/dup-doc-hunter/test/output/debug_html_markdown.txt"
         os.makedirs(os.path.dirname(debug_file), exist_ok=True)
         
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write("HTML 图片标签:\n")
-            f.write("=" * 40 + "\n")
-            for i, tag in enumerate(img_tags):
-                f.write(f"{i+1}. {tag}\n")
-            
-            f.write(f"\n\nMarkdown 内容:\n")
-            f.write("=" * 40 + "\n")
-            f.write(markdown)
+        # 先拼接完整内容，再一次性写入
+        parts = ["HTML 图片标签:\n", "=" * 40 + "\n"]
+        parts.extend(f"{i+1}. {tag}\n" for i, tag in enumerate(img_tags))
+        parts.append("\n\nMarkdown 内容:\n")
+        parts.append("=" * 40 + "\n")
+        parts.append(markdown)
+        with open(debug_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(''.join(parts))
         
         print(f"\n💾 调试信息已保存到: {debug_file}")
         
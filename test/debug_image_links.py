@@ -14,6 +14,15 @@ sys.path.insert(0, str(project_root))
 
 from core.docling_word_converter import DoclingWordToMarkdownConverter
 
+# MinIO 图片链接前缀，用于统计替换后的链接数量
+MINIO_URL_PREFIX = 'http://10.3.70.127:9000'
+
+# 是否在图片替换过程中输出详细调试信息，设置 DUPDOC_DEBUG=0 可关闭
+DEBUG = os.environ.get('DUPDOC_DEBUG', '1') == '1'
+
+# 包含 image 的整行（不区分大小写）
+IMAGE_LINE_RE = re.compile(r'^.*image.*$', re.IGNORECASE | re.MULTILINE)
+
 def debug_image_replacement():
     """调试图片替换问题"""
     
@@ -49,6 +58,9 @@ def debug_image_replacement():
         original_replace_method = converter._replace_images_in_markdown
         
         def debug_replace_images_in_markdown(markdown_text, image_mapping):
+            if not DEBUG:
+                return original_replace_method(markdown_text, image_mapping)
+
             print(f"\n🔍 调试图片替换:")
             print(f"   图片映射: {image_mapping}")
             print(f"   Markdown 文本长度: {len(markdown_text)}")
@@ -68,15 +80,16 @@ def debug_image_replacement():
             
             # 查找包含 image 的行
             print(f"   包含 'image' 的行:")
-            lines = markdown_text.split('\n')
-            for i, line in enumerate(lines):
-                if 'image' in line.lower():
-                    print(f"     第{i+1}行: {line.strip()}")
+            line_no, pos = 1, 0
+            for m in IMAGE_LINE_RE.finditer(markdown_text):
+                line_no += markdown_text.count('\n', pos, m.start())
+                pos = m.start()
+                print(f"     第{line_no}行: {m.group().strip()}")
             
             # 调用原始方法
             result = original_replace_method(markdown_text, image_mapping)
             
-            print(f"   替换后 MinIO 链接数量: {result.count('http://10.3.70.127:9000')}")
+            print(f"   替换后 MinIO 链接数量: {result.count(MINIO_URL_PREFIX)}")
             
             return result
         
@@ -90,11 +103,11 @@ def debug_image_replacement():
         output_file = str(project_root / "test" / "output" / "debug_result.md")
         os.makedirs(str(project_root / "test" / "output"), exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(markdown_content)
         
         print(f"\n✅ 调试完成，结果保存到: {output_file}")
-        print(f"📊 最终 MinIO 链接数量: {markdown_content.count('http://10.3.70.127:9000')}")
+        print(f"📊 最终 MinIO 链接数量: {markdown_content.count(MINIO_URL_PREFIX)}")
         
         # 显示前 500 字符
         print(f"\n📄 内容预览:")
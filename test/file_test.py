@@ -1,9 +1,12 @@
 import os
 import time
+from multiprocessing import Pool
+
 from core.document import Document
-from core.markdown_file_processor import MarkdownFileProcessor
+from core.markdown_document_loader import build_document, init_worker, markdown_to_text
 from core.milvus_minhash_lsh_service import MilvusMinHashLSHService
 
+
 if __name__ == "__main__":
     """
     将指定的文件夹下面的 markdown 进行内容指纹的计算，并存储只 milvus 数据库
@@ -17,8 +20,7 @@ if __name__ == "__main__":
     start_time = time.time()
     print(f"开始处理时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
 
-
-    markdown_sentence_splitter = MarkdownFileProcessor()
+    init_worker()
     # 初始化 Milvus 服务
     service = MilvusMinHashLSHService(
         uri="http://10.3.70.127:19530",
@@ -27,32 +29,32 @@ if __name__ == "__main__":
     service.drop_collection()
     service.create_collection()
     # 1. 从一个指定的文件夹路径 md_folder_path 下读取所有.md结尾的文件，读取文件的到文本 text;
-    markdown_files = [f for f in os.listdir(md_folder_path) if f.endswith('.md')]
+    with os.scandir(md_folder_path) as it:
+        markdown_files = [e for e in it if e.is_file() and e.name.endswith('.md')]
 
     if not markdown_files:
         print(f"目录 '{md_folder_path}' 中未找到 Markdown 文件")
     else:
         print(f"找到 {len(markdown_files)} 个 Markdown 文件")
-    documents = []
-    for i, md_file in enumerate(markdown_files):
-        file_path = os.path.join(md_folder_path, md_file)
-        print(f"\n处理文件: {md_file}")
-        with open(file_path, 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-            content = markdown_sentence_splitter.markdown_to_text(markdown_text)
-            document = Document.from_text(
-                doc_id=i,
-                doc_name=md_file,
-                content=content,
-                num_perm=service.MINHASH_DIM
-            )
+    jobs = [(i, entry.name, entry.path, service.MINHASH_DIM)
+            for i, entry in enumerate(markdown_files)]
+    # 按批次分发任务，避免每个文件一次进程间往返
+    # 分块大小按 Pool.map 的方式计算：任务数 / (进程数 * 4)，有余数时向上取整
+    processes = os.cpu_count() or 1
+    chunksize, extra = divmod(len(jobs), processes * 4)
+    if extra or not chunksize:
+        chunksize += 1
+    with Pool(processes=processes, initializer=init_worker) as pool:
+        documents = []
+        for document in pool.imap(build_document, jobs, chunksize=chunksize):
+            print(f"\n处理文件: {document.doc_name}")
             documents.append(document)
     service.insert_documents(documents)
 
     print("------------------ search testing -------------------------------")
     with open(source_file, 'r', encoding='utf-8') as f:
         markdown_text = f.read()
-        content = markdown_sentence_splitter.markdown_to_text(markdown_text)
+        content = markdown_to_text(markdown_text)
         queryDocument = Document.from_text(
             doc_id=0,
             doc_name=source_file,
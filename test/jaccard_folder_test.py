@@ -1,19 +1,36 @@
 import os
+from multiprocessing import Pool
+
 import numpy as np
-from core.document import Document
-from core.markdown_file_processor import MarkdownFileProcessor
+from core.markdown_document_loader import build_document, init_worker
 
 
-def calculate_jaccard_similarity(sig1, sig2):
+def jaccard_above(sig1, sig2, threshold, chunk_size=32):
     """
-    计算两个 MinHash 签名的 Jaccard 相似度。
-    :param sig1: 第一个签名（NumPy 数组）
-    :param sig2: 第二个签名（NumPy 数组）
-    :return: Jaccard 相似度
+    计算两个 MinHash 签名的 Jaccard 相似度，确定无法超过阈值时提前退出。
+    :param sig1: 第一个签名（np.unique 去重排序后的 NumPy 数组）
+    :param sig2: 第二个签名（np.unique 去重排序后的 NumPy 数组）
+    :param threshold: Jaccard 相似度阈值
+    :param chunk_size: 每次比较的元素个数
+    :return: 超过阈值时返回 Jaccard 相似度，否则返回 None
     """
-    intersection = np.intersect1d(sig1, sig2).size
-    union = np.union1d(sig1, sig2).size
-    return intersection / union
+    n1, n2 = sig1.size, sig2.size
+    # J = I / (n1 + n2 - I) > threshold  <=>  I > threshold * (n1 + n2) / (1 + threshold)
+    need = threshold * (n1 + n2) / (1 + threshold)
+    if min(n1, n2) < need:
+        return None
+
+    intersection = 0
+    for start in range(0, n1, chunk_size):
+        chunk = sig1[start:start + chunk_size]
+        idx = np.minimum(np.searchsorted(sig2, chunk), n2 - 1)
+        intersection += np.count_nonzero(sig2[idx] == chunk)
+        # 剩余元素全部命中也达不到阈值，提前退出
+        if intersection + (n1 - start - chunk.size) < need:
+            return None
+
+    similarity = intersection / (n1 + n2 - intersection)
+    return similarity if similarity > threshold else None
 
 
 def test_directory_similarity(md_folder_path, threshold=0.5):
@@ -22,40 +39,29 @@ def test_directory_similarity(md_folder_path, threshold=0.5):
     :param md_folder_path: Markdown 文件所在目录
     :param threshold: Jaccard 相似度阈值
     """
-    markdown_sentence_splitter = MarkdownFileProcessor()
-
     # 读取目录中的 Markdown 文件
-    markdown_files = [f for f in os.listdir(md_folder_path) if f.endswith('.md')]
+    with os.scandir(md_folder_path) as it:
+        markdown_files = [e for e in it if e.is_file() and e.name.endswith('.md')]
     if not markdown_files:
         print(f"目录 '{md_folder_path}' 中未找到 Markdown 文件")
         return
 
     print(f"找到 {len(markdown_files)} 个 Markdown 文件")
 
-    # 生成每个文件的 MinHash 签名
-    documents = []
-    for i, md_file in enumerate(markdown_files):
-        file_path = os.path.join(md_folder_path, md_file)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-            content = markdown_sentence_splitter.markdown_to_text(markdown_text)
-            document = Document.from_text(
-                doc_id=i,
-                doc_name=md_file,
-                content=content,
-                num_perm=128  # 假设 MinHash 的维度为 128
-            )
-            documents.append(document)
+    # 多进程生成每个文件的 MinHash 签名（假设 MinHash 的维度为 128）
+    jobs = [(i, entry.name, entry.path, 128)
+            for i, entry in enumerate(markdown_files)]
+    with Pool(initializer=init_worker) as pool:
+        documents = pool.map(build_document, jobs)
 
-    # 计算两两文件的相似度
+    # 计算两两文件的相似度，签名只去重排序一次
+    unique_sigs = [np.unique(doc.signature_array) for doc in documents]
     results = []
     for i, doc1 in enumerate(documents):
-        doc1_sig_array = np.frombuffer(doc1.minhash_signature, dtype=np.uint64)
         for j in range(i + 1, len(documents)):  # 避免重复对比
             doc2 = documents[j]
-            doc2_sig_array = np.frombuffer(doc2.minhash_signature, dtype=np.uint64)
-            similarity = calculate_jaccard_similarity(doc1_sig_array, doc2_sig_array)
-            if similarity > threshold:
+            similarity = jaccard_above(unique_sigs[i], unique_sigs[j], threshold)
+            if similarity is not None:
                 results.append((doc1.doc_name, doc2.doc_name, round(similarity, 3)))
 
     # 输出结果
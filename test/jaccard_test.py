@@ -36,41 +36,35 @@ if __name__ == "__main__":
             content=content,
             num_perm=128  # 假设 MinHash 的维度为 128
         )
-    query_sig_array = np.frombuffer(query_document.minhash_signature, dtype=np.uint64)
+    query_sig_array = query_document.signature_array
 
     # 读取文件夹中的 Markdown 文件并计算相似度
-    markdown_files = [f for f in os.listdir(md_folder_path) if f.endswith('.md')]
+    with os.scandir(md_folder_path) as it:
+        markdown_files = [e for e in it if e.is_file() and e.name.endswith('.md')]
     if not markdown_files:
         print(f"目录 '{md_folder_path}' 中未找到 Markdown 文件")
     else:
         print(f"找到 {len(markdown_files)} 个 Markdown 文件")
 
-    results = []
-    for i, md_file in enumerate(markdown_files):
-        file_path = os.path.join(md_folder_path, md_file)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
-            content = markdown_sentence_splitter.markdown_to_text(markdown_text)
-            document = Document.from_text(
-                doc_id=i,
-                doc_name=md_file,
-                content=content,
-                num_perm=128
-            )
-            candidate_sig_array = np.frombuffer(document.minhash_signature, dtype=np.uint64)
-            jaccard_similarity = calculate_jaccard_similarity(query_sig_array, candidate_sig_array)
-            results.append({
-                "doc_id": i,
-                "doc_name": md_file,
-                "similarity": round(jaccard_similarity, 3)
-            })
+    items = []
+    for i, entry in enumerate(markdown_files):
+        with open(entry.path, 'r', encoding='utf-8') as f:
+            content = markdown_sentence_splitter.markdown_to_text(f.read())
+        items.append((i, entry.name, content))
+    documents = Document.from_texts(items, num_perm=128)
+
+    sims = np.empty(len(documents), dtype=np.float64)
+    for i, document in enumerate(documents):
+        sims[i] = calculate_jaccard_similarity(query_sig_array, document.signature_array)
+    sims = np.round(sims, 3)
 
     # 按相似度从高到低排序并打印结果
-    results.sort(key=lambda x: x["similarity"], reverse=True)
+    order = np.argsort(-sims, kind="stable")
     print("------------------ 手动计算 Jaccard 相似度结果 -------------------------------")
-    for idx, result in enumerate(results, start=1):
+    for idx, i in enumerate(order, start=1):
+        document = documents[i]
         print(
-            f"{idx}. Similarity: {result['similarity']:.3f} | doc_id: {result['doc_id']} | doc_name: {result['doc_name']}")
+            f"{idx}. Similarity: {sims[i]:.3f} | doc_id: {document.doc_id} | doc_name: {document.doc_name}")
 
     end_time = time.time()  # 记录结束时间
     print(f"结束处理时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
@@ -3,15 +3,12 @@ from markdown_it import MarkdownIt
 from pathlib import Path
 
 
+_MD = MarkdownIt()
+
+
 def markdown_to_text(md_text: str) -> str:
     """解析 Markdown 为纯文本"""
-    md = MarkdownIt()
-    tokens = md.parse(md_text)
-    text_parts = []
-    for token in tokens:
-        if token.type == "inline":
-            text_parts.append(token.content)
-    return "\n".join(text_parts)
+    return "\n".join(t.content for t in _MD.parse(md_text) if t.type == "inline")
 
 
 def split_sentences(text: str) -> list:
@@ -1,4 +1,89 @@
 import re
+import sys
+from functools import lru_cache
+
+# Markdown 标题行（#），表格行和图片行用字符串判断，不需要正则
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.*)')
+
+# 与 str.splitlines() 相同的换行符集合
+_LINE_BREAK_RE = re.compile('\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def _iter_lines(text):
+    """
+    按 str.splitlines() 的规则逐行生成文本，不一次性构建整个行列表
+
+    :param text: 文本内容
+    :return: 行生成器（不含换行符）
+    """
+    start = 0
+    for m in _LINE_BREAK_RE.finditer(text):
+        yield text[start:m.start()]
+        start = m.end()
+    if start < len(text):
+        yield text[start:]
+
+
+@lru_cache(maxsize=4096)
+def _header_str(filename, parent_title, current_title):
+    """
+    拼接切片引用头（文件名、父标题、当前标题），末尾带分隔内容的空行
+    同一来源的文档标题高度重复，结果缓存并驻留，避免重复分配
+
+    :param filename: 文件名（不需要引用时传空字符串）
+    :param parent_title: 父级标题（二级标题）
+    :param current_title: 当前标题
+    :return: 引用头文本
+    """
+    header = ""
+    if filename:
+        header += f"> 文件名: {filename}\n"
+    if parent_title:
+        header += f"> 父标题: {parent_title}\n"
+    if current_title:
+        header += f"> 当前标题: {current_title}\n"
+    return sys.intern(header + "\n")
+
+
+class _Peekable:
+    """支持前瞻一个元素的迭代器包装，用于表格块的连续行判断"""
+
+    def __init__(self, iterable):
+        self._it = iter(iterable)
+        self._buf = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._buf:
+            return self._buf.pop()
+        return next(self._it)
+
+    def peek(self, default=None):
+        """
+        查看下一个元素但不消费
+
+        :param default: 迭代结束时返回的默认值
+        :return: 下一个元素或 default
+        """
+        if not self._buf:
+            try:
+                self._buf.append(next(self._it))
+            except StopIteration:
+                return default
+        return self._buf[0]
+
+
+def _is_table_line(line):
+    """
+    判断是否 Markdown 表格行，等价于正则 ^\\s*\\|.*\\|\\s*$，但只做一次线性扫描
+
+    :param line: 单行文本（不含换行符）
+    :return: 是否表格行
+    """
+    stripped = line.strip()
+    return len(stripped) >= 2 and stripped[0] == "|" and stripped[-1] == "|"
 
 
 class MarkdownSlicer:
@@ -18,11 +103,6 @@ class MarkdownSlicer:
         self.max_chars = max_chars
         self.add_filename = add_filename
 
-        # 正则匹配
-        self.table_line_re = re.compile(r'^\s*\|.*\|\s*$')  # Markdown 表格行
-        self.image_line_re = re.compile(r'!\[.*\]\(.*\)')  # Markdown 图片行
-        self.heading_re = re.compile(r'^(#{1,6})\s+(.*)')  # Markdown 标题行（#）
-
     def slice(self, md_text, filename=""):
         """
         将 Markdown 文本切片
@@ -31,72 +111,95 @@ class MarkdownSlicer:
         :param filename: 文件名（可选，用于切片引用）
         :return: 切片列表，每个元素是一段 Markdown 文本
         """
-        lines = md_text.splitlines()
-        slices = []  # 存储切片结果
+        return list(self.iter_slices(md_text, filename))
+
+    def iter_slices(self, md_text, filename=""):
+        """
+        将 Markdown 文本切片，逐片生成，不在内存中保留全部切片
+
+        :param md_text: Markdown 文本内容
+        :param filename: 文件名（可选，用于切片引用）
+        :return: 切片生成器，每个元素是一段 Markdown 文本
+        """
+        lines = _Peekable(_iter_lines(md_text))
         current_slice = []  # 当前累积切片内容
         current_len = 0  # 当前切片长度
+        # 切片引用头：文件名在整篇文档内不变，父标题/当前标题只在遇到对应标题时更新
+        ref_filename = filename if self.add_filename else ""
         parent_title = ""  # 当前父级标题（二级标题）
         current_title = ""  # 当前标题（三级及以上标题）
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        header = _header_str(ref_filename, parent_title, current_title)
+
+        def flush():
+            """生成当前累积切片的文本，并重置累积状态"""
+            nonlocal current_slice, current_len
+            slice_content = self._build_slice(current_slice, header)
+            current_slice = []
+            current_len = 0
+            return slice_content
+
+        _match_heading = _HEADING_RE.match
+        for line in lines:
+            # 按行首字符分派：标题行以 '#' 开头，图片行以 '!' 开头，
+            # 其余行再判断是否表格行，都不是则按普通段落处理
+            first = line[:1]
+            kind = None
+            if first == "#":
+                m = _match_heading(line)
+                if m:
+                    kind = "heading"
+            elif first == "!":
+                # Markdown 图片行：![...](...)
+                j = line.find("](", 2)
+                if line.startswith("![") and j >= 0 and line.find(")", j + 2) >= 0:
+                    kind = "image"
+            elif _is_table_line(line):
+                kind = "table"
 
             # 检查是否标题行
-            heading_match = self.heading_re.match(line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                title_text = heading_match.group(2).strip()
+            if kind == "heading":
+                level = len(m.group(1))
+                title_text = m.group(2).strip()
 
                 # 二级标题作为父标题，用于切片引用
                 if level == 2:
                     parent_title = title_text
-                    i += 1
+                    header = _header_str(ref_filename, parent_title, current_title)
                     continue
 
                 # 遇到三级及以上标题时，先切分当前片
                 if current_slice:
-                    slice_content = self._build_slice(current_slice, filename, parent_title, current_title)
-                    slices.append(slice_content)
-                    current_slice = []
-                    current_len = 0
+                    yield flush()
 
                 current_title = title_text
+                header = _header_str(ref_filename, parent_title, current_title)
                 # 将标题加入新切片开头
                 current_slice.append(line + "\n")
                 current_len += len(line) + 1
-                i += 1
                 continue
 
             # 处理表格块：连续的表格行归为一个块
-            if self.table_line_re.match(line):
-                block_lines = []
-                while i < len(lines) and self.table_line_re.match(lines[i]):
-                    block_lines.append(lines[i])
-                    i += 1
+            if kind == "table":
+                block_lines = [line]
+                while _is_table_line(lines.peek("")):
+                    block_lines.append(next(lines))
                 block_text = "\n".join(block_lines) + "\n"
 
             # 处理图片行
-            elif self.image_line_re.match(line):
+            elif kind == "image":
                 block_text = line + "\n"
-                i += 1
 
             # 普通段落
             else:
                 block_text = line + "\n"
-                i += 1
 
             # 如果当前切片加上本段超过 max_chars，先切片
             if current_len + len(block_text) > self.max_chars and current_slice:
-                slice_content = self._build_slice(current_slice, filename, parent_title, current_title)
-                slices.append(slice_content)
-                current_slice = []
-                current_len = 0
+                yield flush()
 
             # 如果块本身长度超过 max_chars，单独切片（保证块完整性）
             if len(block_text) > self.max_chars:
-                slice_content = self._build_slice([block_text], filename, parent_title, current_title)
-                slices.append(slice_content)
+                yield self._build_slice([block_text], header)
                 continue
 
             # 将当前块加入切片
@@ -105,32 +208,18 @@ class MarkdownSlicer:
 
         # 最后一片
         if current_slice:
-            slice_content = self._build_slice(current_slice, filename, parent_title, current_title)
-            slices.append(slice_content)
-
-        return slices
+            yield flush()
 
-    def _build_slice(self, lines, filename, parent_title, current_title):
+    def _build_slice(self, lines, header):
         """
-        构建切片文本，添加文件名、父标题、当前标题引用
+        构建切片文本，在内容前加上文件名、父标题、当前标题引用
         使用 Markdown 引用 '>' 格式
 
         :param lines: 切片内容块
-        :param filename: 文件名
-        :param parent_title: 父级标题（二级标题）
-        :param current_title: 当前标题
+        :param header: 已拼接好的引用头（每行以换行结尾，末尾带分隔空行）
         :return: 切片文本
         """
-        header_lines = []
-        if self.add_filename and filename:
-            header_lines.append(f"> 文件名: {filename}")
-        if parent_title:
-            header_lines.append(f"> 父标题: {parent_title}")
-        if current_title:
-            header_lines.append(f"> 当前标题: {current_title}")
-        # 空行分隔引用和内容
-        header_lines.append("")
-        return "\n".join(header_lines + lines)
+        return header + "\n".join(lines)
 
 
 # ================= 使用示例 =================
@@ -141,7 +230,7 @@ if __name__ == "__main__":
 
     # 初始化切片器
     slicer = MarkdownSlicer(max_chars=1000, add_filename=True)
-    md_slices = slicer.slice(md_text, filename="sample.md")
+    md_slices = slicer.iter_slices(md_text, filename="sample.md")
 
     # 打印每片切片
     for idx, s in enumerate(md_slices, 1):
@@ -1,4 +1,9 @@
+import sys
+from functools import lru_cache
+
+import numpy as np
 from datasketch import MinHash
+from datasketch.hashfunc import sha1_hash32
 from pymilvus import MilvusClient
 
 from pymilvus import DataType
@@ -9,15 +14,66 @@ client = MilvusClient(uri="http://10.3.70.127:19530")  # Update if your URI is d
 MINHASH_DIM = 256
 HASH_BIT_WIDTH = 64
 
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+# Tokens permuted per numpy pass: bounds the working matrix to TOKEN_BATCH x num_perm
+# uint64 values (8 MiB at 256 permutations) regardless of corpus size
+TOKEN_BATCH = 4096
+
+# ASCII fast path: lowercase A-Z and turn \x1c-\x1f (whitespace for str.split()) into spaces,
+# so bytes.split() on the translated text yields the same tokens as text.lower().split()
+ASCII_LOWER_TABLE = bytes.maketrans(
+    bytes(range(0x41, 0x5b)) + bytes(range(0x1c, 0x20)),
+    bytes(range(0x61, 0x7b)) + b" " * 4
+)
+
+
+@lru_cache(maxsize=None)
+def minhash_permutations(num_perm=MINHASH_DIM):
+    # Same (a, b) coefficients as datasketch.MinHash, generated once per num_perm
+    return MinHash(num_perm=num_perm).permutations
+
+
+def tokenize(text) -> list:
+    # Lowercased whitespace-separated tokens as utf-8 bytes
+    if text.isascii():
+        return text.encode("ascii").translate(ASCII_LOWER_TABLE).split()
+    return [token.encode("utf8") for token in text.lower().split()]
+
+
 def generate_minhash_signature(text, num_perm=MINHASH_DIM) -> bytes:
-    m = MinHash(num_perm=num_perm)
-    for token in text.lower().split():
-        m.update(token.encode("utf8"))
-    return m.hashvalues.astype('>u8').tobytes()  # Returns 2048 bytes
+    return generate_minhash_signatures([text], num_perm)[0]  # Returns 2048 bytes
+
+
+def generate_minhash_signatures(texts, num_perm=MINHASH_DIM) -> list:
+    # Hash the tokens of all documents into one flat array, then permute it in bounded
+    # chunks of TOKEN_BATCH tokens so the (tokens x num_perm) matrix never covers the
+    # whole corpus; each chunk's per-document segments are min-reduced with
+    # np.minimum.reduceat and folded into the running signatures
+    a, b = minhash_permutations(num_perm)
+    token_lists = [tokenize(text) for text in texts]
+    counts = np.array([len(tokens) for tokens in token_lists], dtype=np.int64)
+    hv = np.fromiter(
+        (sha1_hash32(token) for tokens in token_lists for token in tokens),
+        dtype=np.uint64, count=int(counts.sum())
+    )
+    doc_index = np.repeat(np.arange(len(token_lists)), counts)
+    sigs = np.full((len(token_lists), num_perm), MAX_HASH, dtype=np.uint64)
+    for start in range(0, hv.size, TOKEN_BATCH):
+        chunk_docs = doc_index[start:start + TOKEN_BATCH]
+        phv = (hv[start:start + TOKEN_BATCH, None] * a + b) % MERSENNE_PRIME & MAX_HASH
+        seg_starts = np.flatnonzero(np.r_[True, chunk_docs[1:] != chunk_docs[:-1]])
+        docs = chunk_docs[seg_starts]
+        sigs[docs] = np.minimum(sigs[docs], np.minimum.reduceat(phv, seg_starts, axis=0))
+    # Big-endian output: swap in place instead of allocating an astype('>u8') copy
+    if sys.byteorder == "little":
+        sigs.byteswap(inplace=True)
+    return [row.tobytes() for row in sigs]
+
 
 def extract_token_set(text: str) -> str:
-    tokens = set(text.lower().split())
-    return " ".join(tokens)
+    # dict.fromkeys dedups while keeping first-seen order
+    return b" ".join(dict.fromkeys(tokenize(text))).decode("utf8")
 
 
 if __name__ == "__main__":
@@ -52,16 +108,12 @@ if __name__ == "__main__":
         "The quick brown fox leaps over a sleepy dog"
     ]
 
-    insert_data = []
-    for i, doc in enumerate(documents):
-        sig = generate_minhash_signature(doc)
-        token_str = extract_token_set(doc)
-        insert_data.append({
-            "doc_id": i,
-            "minhash_signature": sig,
-            "token_set": token_str,
-            "document": doc
-        })
+    # One batched insert; MilvusClient.insert takes rows, so build them in a single pass
+    signatures = generate_minhash_signatures(documents)
+    insert_data = [
+        {"doc_id": i, "minhash_signature": sig, "token_set": extract_token_set(doc), "document": doc}
+        for i, (doc, sig) in enumerate(zip(documents, signatures))
+    ]
 
     client.insert("minhash_demo", insert_data)
     client.flush("minhash_demo")
@@ -3,12 +3,27 @@
 测试 Docling HTML 转换器功能
 """
 
+import logging
+import re
 import sys
 import os
+from pathlib import Path
 sys.path.append('/Users/joe/codes/gitee/dup-doc-hunter')
 
 from core.docling_html_converter import DoclingHtmlToMarkdownConverter
 
+# 逐条图片链接等明细只在 DEBUG 级别输出（LOG=DEBUG）
+logger = logging.getLogger(__name__)
+
+# 优先使用 re2（DFA，线性时间），未安装时退回标准库 re
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Markdown 图片链接：![alt](url)
+IMG_LINK_RE = _regex.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
 def test_basic_html_conversion():
     """测试基础 HTML 转换功能（不处理图片）"""
     
@@ -75,8 +90,7 @@ def test_basic_html_conversion():
         # 保存结果
         output_file = "/Users/joe/codes/gitee/dup-doc-hunter/test/output/html_conversion_result.md"
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_result)
+        Path(output_file).write_bytes(markdown_result.encode('utf-8'))
         print(f"\n💾 结果已保存到: {output_file}")
         
     except Exception as e:
@@ -90,10 +104,11 @@ def test_html_url_conversion():
     print("\n🧪 测试 HTML URL 转换功能")
     print("=" * 60)
     
-    # 创建使用原始图片链接的转换器（推荐用于 HTML）
+    # 创建使用原始图片链接的转换器（推荐用于 HTML），并在交给 Docling 前清理脚本和样式
     converter = DoclingHtmlToMarkdownConverter(
             # 不需要配置 MinIO，因为我们使用原始链接
-            use_original_image_urls=True  # 关键配置：使用原始图片链接
+            use_original_image_urls=True,  # 关键配置：使用原始图片链接
+            clean_html=True
         )
     
     # 测试一个包含图片的网页
@@ -102,6 +117,7 @@ def test_html_url_conversion():
     try:
         print(f"🔄 开始转换 URL: {test_url}")
         print("🔗 使用原始图片链接模式（避免图片扎堆问题）")
+        print("🧹 转换前使用 lxml 清理 script/style")
         
         markdown_result = converter.convert_html_url_to_markdown(test_url)
         
@@ -109,14 +125,14 @@ def test_html_url_conversion():
         print(f"   Markdown 总长度: {len(markdown_result)} 字符")
         
         # 统计图片链接
-        import re
-        image_links = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', markdown_result)
+        image_links = IMG_LINK_RE.findall(markdown_result)
         print(f"   图片链接数量: {len(image_links)}")
         
         if image_links:
-            print(f"\n🖼️ 找到的图片链接:")
-            for i, (alt_text, url) in enumerate(image_links):
-                print(f"   {i+1}. Alt: '{alt_text}' -> URL: {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("\n🖼️ 找到的图片链接:")
+                for i, (alt_text, url) in enumerate(image_links, 1):
+                    logger.debug("   %d. Alt: '%s' -> URL: %s", i, alt_text, url)
         else:
             print("   没有找到图片链接")
         
@@ -132,8 +148,7 @@ def test_html_url_conversion():
         
         # 保存结果
         output_file = "/Users/joe/codes/gitee/dup-doc-hunter/test/output/html_url_result.md"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_result)
+        Path(output_file).write_bytes(markdown_result.encode('utf-8'))
         print(f"\n💾 结果已保存到: {output_file}")
         
         # 验证结果
@@ -190,8 +205,7 @@ def test_html_with_minio():
         
         # 保存结果
         output_file = "/Users/joe/codes/gitee/dup-doc-hunter/test/output/html_with_images_result.md"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_result)
+        Path(output_file).write_bytes(markdown_result.encode('utf-8'))
         print(f"\n💾 结果已保存到: {output_file}")
         
     except Exception as e:
@@ -200,6 +214,7 @@ def test_html_with_minio():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG", "INFO").upper(), format="%(message)s")
     print("🚀 Docling HTML 转换器测试开始")
     print("=" * 80)
     
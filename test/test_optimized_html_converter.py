@@ -3,12 +3,27 @@
 测试优化后的 HTML 图片处理功能
 """
 
+import logging
+import re
 import sys
 import os
+from pathlib import Path
 sys.path.append('/Users/joe/codes/gitee/dup-doc-hunter')
 
 from core.docling_html_converter import DoclingHtmlToMarkdownConverter
 
+# 逐条图片链接等明细只在 DEBUG 级别输出（LOG=DEBUG）
+logger = logging.getLogger(__name__)
+
+# 优先使用 re2（DFA，线性时间），未安装时退回标准库 re
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Markdown 图片链接：![alt](url)
+IMG_LINK_RE = _regex.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
 def test_optimized_html_conversion():
     """测试优化后的 HTML 转换功能"""
     
@@ -33,17 +48,19 @@ def test_optimized_html_conversion():
         print(f"   📝 Markdown 长度: {len(markdown_result):,} 字符")
         
         # 统计图片链接
-        import re
-        image_links = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', markdown_result)
-        unique_urls = set(url for _, url in image_links)
+        unique_urls = set()
+        total_links = 0
+        for m in IMG_LINK_RE.finditer(markdown_result):
+            unique_urls.add(m.group(2))
+            total_links += 1
         
-        print(f"   🖼️ 图片链接总数: {len(image_links)}")
+        print(f"   🖼️ 图片链接总数: {total_links}")
         print(f"   🔗 唯一图片 URL: {len(unique_urls)}")
         
-        if unique_urls:
-            print(f"\n🎨 唯一图片 URL 列表:")
+        if unique_urls and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n🎨 唯一图片 URL 列表:")
             for i, url in enumerate(sorted(unique_urls), 1):
-                print(f"   {i}. {url}")
+                logger.debug("   %d. %s", i, url)
         
         # 显示一小段内容
         print(f"\n📄 内容预览 (前 300 字符):")
@@ -56,8 +73,7 @@ def test_optimized_html_conversion():
         output_file = "/Users/joe/codes/gitee/dup-doc-hunter/test/output/optimized_html_result.md"
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_result)
+        Path(output_file).write_bytes(markdown_result.encode('utf-8'))
         
         print(f"\n💾 结果已保存到: {output_file}")
         
@@ -73,4 +89,5 @@ def test_optimized_html_conversion():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG", "INFO").upper(), format="%(message)s")
     test_optimized_html_conversion()
@@ -54,14 +54,14 @@ def test_with_real_minio():
                     output_file = f"output/test_{Path(test_file).stem}_with_minio.md"
                     os.makedirs("output", exist_ok=True)
                     
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(markdown_content)
+                    markdown_bytes = markdown_content.encode('utf-8')
+                    Path(output_file).write_bytes(markdown_bytes)
                     
                     print(f"✅ 转换完成: {output_file}")
                     
                     # 检查是否有图片链接被替换
-                    if "http://10.3.70.127:9000" in markdown_content:
-                        image_count = markdown_content.count("http://10.3.70.127:9000")
+                    image_count = markdown_content.count("http://10.3.70.127:9000")
+                    if image_count:
                         print(f"🖼️ 发现 {image_count} 个 MinIO 图片链接")
                     
                     print(f"📄 内容预览（前 300 字符）:")
@@ -72,7 +72,7 @@ def test_with_real_minio():
                     print("-" * 40)
                     
                     # 显示文件大小
-                    file_size = len(markdown_content.encode('utf-8'))
+                    file_size = len(markdown_bytes)
                     print(f"📊 文件大小: {file_size} 字节")
                     
                 except Exception as e:
@@ -1,8 +1,28 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from docling.document_converter import DocumentConverter
 
+# Docling 转换器在构造时加载模型/流水线，进程内只创建一次
+_CONVERTER = None
+
+# 每个工作进程都会加载一份 Docling 模型，限制进程数以控制内存占用
+MAX_CONVERT_WORKERS = 4
+
+
+def _get_converter() -> DocumentConverter:
+    """
+    获取进程内共享的 Docling 转换器，首次调用时创建
+    
+    Returns:
+        DocumentConverter: Docling 转换器实例
+    """
+    global _CONVERTER
+    if _CONVERTER is None:
+        _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
 
 def convert_doc_to_markdown(source_file: str, target_file: str) -> bool:
     """
@@ -34,8 +54,8 @@ def convert_doc_to_markdown(source_file: str, target_file: str) -> bool:
         target_path = Path(target_file)
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # 初始化 Docling 转换器
-        converter = DocumentConverter()
+        # 获取共享的 Docling 转换器
+        converter = _get_converter()
         
         print(f"🔄 开始转换文件: {source_file}")
         
@@ -47,8 +67,7 @@ def convert_doc_to_markdown(source_file: str, target_file: str) -> bool:
         markdown_text = doc.export_to_markdown()
         
         # 保存为 .md 文件
-        with open(target_file, "w", encoding="utf-8") as f:
-            f.write(markdown_text)
+        Path(target_file).write_bytes(markdown_text.encode("utf-8"))
             
         print(f"✅ 转换完成，已生成 Markdown 文件: {target_file}")
         return True
@@ -87,21 +106,34 @@ def main():
     success_count = 0
     total_count = len(word_files)
     
-    for word_file in word_files:
-        print(f"\n📄 处理文档: {word_file.name}")
-        
-        # 生成对应的 Markdown 文件名
-        md_filename = word_file.stem + ".md"
-        target_file = output_dir / md_filename
-        
-        # 转换文档
-        success = convert_doc_to_markdown(str(word_file), str(target_file))
+    # 多进程并行转换，每个工作进程在首个任务中创建自己的 Docling 转换器，
+    # 创建失败时由 convert_doc_to_markdown 捕获并计为该文件转换失败
+    max_workers = min(total_count, MAX_CONVERT_WORKERS)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for word_file in word_files:
+            # 生成对应的 Markdown 文件名
+            md_filename = word_file.stem + ".md"
+            target_file = output_dir / md_filename
+            
+            # 提交转换任务
+            future = executor.submit(convert_doc_to_markdown, str(word_file), str(target_file))
+            futures[future] = (word_file, md_filename)
         
-        if success:
-            success_count += 1
-            print(f"✅ 成功转换: {word_file.name} -> {md_filename}")
-        else:
-            print(f"❌ 转换失败: {word_file.name}")
+        for future in as_completed(futures):
+            word_file, md_filename = futures[future]
+            print(f"\n📄 处理文档: {word_file.name}")
+            try:
+                converted = future.result()
+            except Exception as e:
+                # 工作进程异常退出（如被 OOM 终止）时计为失败，继续统计其余文件
+                print(f"❌ 转换进程异常: {word_file.name}: {e}")
+                converted = False
+            if converted:
+                success_count += 1
+                print(f"✅ 成功转换: {word_file.name} -> {md_filename}")
+            else:
+                print(f"❌ 转换失败: {word_file.name}")
     
     print("\n" + "=" * 60)
     print(f"📊 转换完成统计:")
@@ -1,64 +1,111 @@
+import hashlib
 import os
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from docx import Document
 from docx.oxml import parse_xml
 from docx.oxml.ns import qn
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 # ===== MinIO 配置 =====
 MINIO_ENDPOINT = "http://10.3.70.127:9000"
 MINIO_ACCESS_KEY = "minioadmin"
 MINIO_SECRET_KEY = "minioadmin"
 MINIO_BUCKET = "md-images"
+MINIO_UPLOAD_WORKERS = 16  # 并发上传图片的线程数
+
+# ===== OOXML 标签常量 =====
+PIC_TAG = "{http://schemas.openxmlformats.org/drawingml/2006/picture}pic"
+BLIP_PATH = ".//{http://schemas.openxmlformats.org/drawingml/2006/main}blip"
+P_TAG, TBL_TAG = qn("w:p"), qn("w:tbl")
+
+# 常见图片 content type -> 文件扩展名（image/jpeg 统一为 jpg）
+_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/svg+xml": "svg",
+    "image/webp": "webp",
+}
 
 s3 = boto3.client(
     "s3",
     endpoint_url=MINIO_ENDPOINT,
     aws_access_key_id=MINIO_ACCESS_KEY,
     aws_secret_access_key=MINIO_SECRET_KEY,
-    region_name="us-east-1"
+    region_name="us-east-1",
+    # 连接池与上传线程数匹配，并开启 keep-alive 复用连接
+    config=Config(
+        max_pool_connections=32,
+        retries={"max_attempts": 3, "mode": "standard"},
+        tcp_keepalive=True,
+    ),
 )
 
-def upload_to_minio(local_file, bucket, object_name=None):
-    if object_name is None:
-        object_name = os.path.basename(local_file)
-    s3.upload_file(local_file, bucket, object_name)
+def minio_url(bucket, object_name):
     return f"{MINIO_ENDPOINT}/{bucket}/{object_name}"
 
+# 本进程内已上传或正在上传的对象名（对象名由内容哈希生成，同名即同内容）
+_uploaded = set()
+
+def _forget_failed_upload(object_name, future):
+    """上传任务完成回调：上传失败时把对象名移出 _uploaded"""
+    if future.exception() is not None:
+        _uploaded.discard(object_name)
+
+def upload_to_minio(data, bucket, object_name, content_type=None):
+    """直接上传内存中的字节到 MinIO，不落地临时文件；对象已存在时跳过上传"""
+    try:
+        s3.head_object(Bucket=bucket, Key=object_name)
+        return minio_url(bucket, object_name)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+            raise
+    extra = {"ContentType": content_type} if content_type else {}
+    s3.put_object(Bucket=bucket, Key=object_name, Body=data, **extra)
+    return minio_url(bucket, object_name)
+
 def escape_pipe(text):
     return text.replace("|", "\\|")
 
 def table_to_markdown(table):
     rows = []
     for i, row in enumerate(table.rows):
-        cells = [escape_pipe(cell.text.strip()) for cell in row.cells]
-        rows.append("| " + " | ".join(cells) + " |")
+        row_cells = row.cells  # python-docx 每次访问都会重新构建单元格列表
+        cells = [escape_pipe(cell.text.strip()) for cell in row_cells]
+        rows.append(f"| {' | '.join(cells)} |")
         if i == 0:
-            sep = ["---"] * len(row.cells)
-            rows.append("| " + " | ".join(sep) + " |")
-    return "\n".join(rows) + "\n"
-
-def extract_inline_image(run, output_dir="output/media"):
-    """提取 run 内图片并上传 MinIO，返回 Markdown URL"""
-    os.makedirs(output_dir, exist_ok=True)
-    # 遍历 run 元素子孙节点，找到 pic:pic 元素
-    for child in run._element.iter():
-        if child.tag.endswith('pic'):
-            # 获取 blip 节点
-            blip = child.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}blip')
-            if blip is not None:
-                rId = blip.get(qn("r:embed"))
-                image_part = run.part.related_parts[rId]
-                ext = image_part.content_type.split("/")[-1]
-                img_name = f"{uuid.uuid4().hex}.{ext}"
-                local_path = os.path.join(output_dir, img_name)
-                with open(local_path, "wb") as f:
-                    f.write(image_part.blob)
-                # 上传到 MinIO
-                url = upload_to_minio(local_path, MINIO_BUCKET, f"media/{img_name}")
-                # 删除本地临时文件
-                os.remove(local_path)
-                return url
+            rows.append(f"| {' | '.join(['---'] * len(row_cells))} |")
+    rows.append("")  # join 后以换行结尾
+    return "\n".join(rows)
+
+def extract_inline_image(run, rels, pool, uploads):
+    """
+    提取 run 内图片并提交到线程池上传 MinIO，返回 Markdown URL
+    rels 为文档的 rId -> part 映射；上传任务的 future 追加到 uploads，由调用方等待完成
+    """
+    # 只遍历 run 中的 pic:pic 元素（由 lxml 按标签过滤）
+    for pic in run._element.iter(PIC_TAG):
+        # 获取 blip 节点
+        blip = pic.find(BLIP_PATH)
+        if blip is not None:
+            rId = blip.get(qn("r:embed"))
+            image_part = rels[rId]
+            blob = image_part.blob
+            content_type = image_part.content_type
+            ext = _EXT.get(content_type) or content_type.rsplit("/", 1)[-1]
+            # 以内容哈希作为对象名，同一图片多次引用只上传一次
+            object_name = f"media/{hashlib.blake2b(blob, digest_size=16).hexdigest()}.{ext}"
+            if object_name not in _uploaded:
+                # 提交时先占位，避免同一图片重复提交；上传失败时移除，后续转换会重新上传
+                _uploaded.add(object_name)
+                # 对象名在上传前已确定，URL 可以直接返回，上传在后台线程进行
+                future = pool.submit(upload_to_minio, blob, MINIO_BUCKET, object_name, content_type)
+                future.add_done_callback(partial(_forget_failed_upload, object_name))
+                uploads.append(future)
+            return minio_url(MINIO_BUCKET, object_name)
     return None
 
 def convert_docx_to_md(docx_path, output_dir="output"):
@@ -66,45 +113,54 @@ def convert_docx_to_md(docx_path, output_dir="output"):
     md_path = os.path.join(output_dir, f"{os.path.splitext(os.path.basename(docx_path))[0]}.md")
 
     doc = Document(docx_path)
+    rels = doc.part.related_parts
     md_lines = []
-
-    for block in doc.element.body:
-        tag = block.tag.split("}")[1]
-
-        # 表格
-        if tag == "tbl":
-            table = next((t for t in doc.tables if t._element == block), None)
-            if table:
-                md_lines.append(table_to_markdown(table))
-            continue
-
-        # 段落
-        if tag == "p":
-            para = next((p for p in doc.paragraphs if p._element == block), None)
-            if para:
-                style = para.style.name.lower() if para.style else "normal"
-                line_parts = []
-
-                for run in para.runs:
-                    text = run.text
-                    img_url = extract_inline_image(run, os.path.join(output_dir, "media"))
-                    if img_url:
-                        line_parts.append(f"![image]({img_url})")
-                    if text:
-                        line_parts.append(text)
-                line = "".join(line_parts).strip()
-                if not line:
-                    continue
-
-                # 标题
-                if "heading" in style:
-                    level = int(style.replace("heading ", ""))
-                    md_lines.append("#" * level + " " + line + "\n")
-                # 列表
-                elif style.startswith("list"):
-                    md_lines.append(f"- {line}\n")
-                else:
-                    md_lines.append(line + "\n")
+    uploads = []  # 图片上传任务
+    # 元素 -> 段落/表格 对象映射，避免每个块都线性扫描全部段落和表格
+    para_map = {p._element: p for p in doc.paragraphs}
+    tbl_map = {t._element: t for t in doc.tables}
+
+    with ThreadPoolExecutor(max_workers=MINIO_UPLOAD_WORKERS) as pool:
+        # 只遍历 body 下的段落和表格（由 lxml 按标签过滤）
+        for block in doc.element.body.iterchildren(P_TAG, TBL_TAG):
+            # 表格
+            if block.tag == TBL_TAG:
+                table = tbl_map.get(block)
+                if table:
+                    md_lines.append(table_to_markdown(table))
+                continue
+
+            # 段落
+            if block.tag == P_TAG:
+                para = para_map.get(block)
+                if para:
+                    style = para.style.name.lower() if para.style else "normal"
+                    line_parts = []
+
+                    for run in para.runs:
+                        text = run.text
+                        img_url = extract_inline_image(run, rels, pool, uploads)
+                        if img_url:
+                            line_parts.append(f"![image]({img_url})")
+                        if text:
+                            line_parts.append(text)
+                    line = "".join(line_parts).strip()
+                    if not line:
+                        continue
+
+                    # 标题
+                    if "heading" in style:
+                        level = int(style.replace("heading ", ""))
+                        md_lines.append(f"{'#' * level} {line}\n")
+                    # 列表
+                    elif style.startswith("list"):
+                        md_lines.append(f"- {line}\n")
+                    else:
+                        md_lines.append(f"{line}\n")
+
+        # 等待全部图片上传完成，上传失败时抛出异常
+        for future in uploads:
+            future.result()
 
     # 保存 Markdown
     with open(md_path, "w", encoding="utf-8") as f: